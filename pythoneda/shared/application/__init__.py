@@ -23,6 +23,7 @@ __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 from .bootstrap import Bootstrap
 from .pythoneda import PythonEDA
+from .pythoneda_finder import PythonEDAFinder
 from .enable import enable
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
@@ -19,16 +19,17 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from collections import deque
 import importlib
 import importlib.util
 import inspect
 import os
-from pathlib import Path
-import pkgutil
 import sys
 from typing import Callable, Dict, List
 import warnings
 
+_IGNORED_PATH_FRAGMENTS = (".grpc.", ".logging.", ".git.")
+
 
 class Bootstrap:
     """
@@ -48,6 +49,10 @@ class Bootstrap:
     _infrastructure_packages = {}
     _domain_modules = {}
     _infrastructure_modules = {}
+    _types_of_paths = {}
+    _project_stops = None
+    _marker_files = {}
+    _layers_of_folders = {}
 
     @classmethod
     def instance(cls):
@@ -137,9 +142,9 @@ class Bootstrap:
             folder = os.path.dirname(folder)
 
         current_path = folder
-        while (
-            Path(current_path) / "__init__.py"
-        ).exists() and current_path != os.path.dirname(current_path):
+        while os.path.exists(
+            os.path.join(current_path, "__init__.py")
+        ) and current_path != os.path.dirname(current_path):
             yield current_path
             current_path = os.path.dirname(current_path)
 
@@ -155,13 +160,28 @@ class Bootstrap:
 
         folder = os.path.dirname(path.rstrip("/"))
 
-        if (Path(folder) / "__init__.py").exists() and folder != os.path.dirname(
-            folder
+        if os.path.exists(os.path.join(folder, "__init__.py")) and folder != (
+            os.path.dirname(folder)
         ):
             result = folder
 
         return result
 
+    @classmethod
+    def marker_file(cls, type) -> str:
+        """
+        Retrieves the name of the file marking a folder as of given type.
+        :param type: The type of package.
+        :type type: pythoneda.shared.artifact.HexagonalLayer
+        :return: Such file name, e.g. ".pythoneda-domain".
+        :rtype: str
+        """
+        result = cls._marker_files.get(type, None)
+        if result is None:
+            result = f".pythoneda-{type.name.lower()}"
+            cls._marker_files[type] = result
+        return result
+
     def single_path_is_of_type(self, path: str, type) -> bool:
         """
         Checks if given path, and just that, is marked as of given type.
@@ -175,7 +195,7 @@ class Bootstrap:
         folder = path
         if not os.path.isdir(path.rstrip("/")):
             folder = os.path.dirname(path)
-        return (Path(folder) / f".pythoneda-{type.name.lower()}").exists()
+        return os.path.exists(os.path.join(folder, self.__class__.marker_file(type)))
 
     def single_path_is_not_of_type(self, path: str, type) -> bool:
         """
@@ -192,6 +212,32 @@ class Bootstrap:
             for other_type in type.all_but()
         )
 
+    @classmethod
+    def project_stops(cls) -> frozenset:
+        """
+        Retrieves the folders no package can extend beyond, i.e. the "site-packages" entries in sys.path.
+        :return: Such folders.
+        :rtype: frozenset
+        """
+        if cls._project_stops is None:
+            cls._project_stops = frozenset(
+                os.path.abspath(p) for p in sys.path if "site-packages" in p
+            )
+        return cls._project_stops
+
+    def is_project_stop(self, path: str) -> bool:
+        """
+        Checks if given path is the root of an installation, so its parents cannot be part of any package.
+        :param path: The path.
+        :type path: str
+        :return: True if so.
+        :rtype: bool
+        """
+        folder = path.rstrip("/")
+        if not os.path.isdir(folder):
+            folder = os.path.dirname(folder)
+        return os.path.abspath(folder) in self.__class__.project_stops()
+
     def is_of_type(self, path: str, type) -> bool:  #: HexagonalLayer) -> bool:
         """
         Checks if given path is marked as of given type.
@@ -202,21 +248,68 @@ class Bootstrap:
         :return: True if so.
         :rtype: bool
         """
-        import sys
-
         result = False
         if path is None:
             return False
 
-        from pythoneda.shared.artifact import HexagonalLayer
+        key = (path, type)
+        result = self.__class__._types_of_paths.get(key, None)
+        if result is not None:
+            return result
 
         if self.single_path_is_of_type(path, type):
             result = True
         elif self.single_path_is_not_of_type(path, type):
             result = False
+        elif self.is_project_stop(path):
+            result = False
         else:
             result = self.is_of_type(self.get_folder_of_parent_package(path), type)
 
+        self.__class__._types_of_paths[key] = result
+
+        return result
+
+    def classify_package(self, packagePath: str) -> frozenset:
+        """
+        Retrieves the layers given package is marked as, reading each folder once
+        for all markers instead of checking each marker separately.
+        :param packagePath: The package path.
+        :type packagePath: str
+        :return: The layers, empty if the package isn't marked at all.
+        :rtype: frozenset[pythoneda.shared.artifact.HexagonalLayer]
+        """
+        if packagePath is None:
+            return frozenset()
+
+        folder = packagePath.rstrip("/")
+        if not os.path.isdir(folder):
+            folder = os.path.dirname(folder)
+
+        cache = self.__class__._layers_of_folders
+        result = cache.get(folder, None)
+        if result is not None:
+            return result
+
+        from pythoneda.shared.artifact import HexagonalLayer
+
+        markers = {
+            self.__class__.marker_file(layer): layer for layer in HexagonalLayer
+        }
+        try:
+            with os.scandir(folder) as entries:
+                result = frozenset(
+                    markers[entry.name] for entry in entries if entry.name in markers
+                )
+        except OSError:
+            result = frozenset()
+
+        # the closest marked folder decides, up to the installation root
+        if not result and not self.is_project_stop(folder):
+            result = self.classify_package(self.get_folder_of_parent_package(folder))
+
+        cache[folder] = result
+
         return result
 
     def is_domain_module(self, module) -> bool:
@@ -266,12 +359,14 @@ class Bootstrap:
         :rtype: List
         """
         result = []
+        seen = set()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=DeprecationWarning)
             try:
                 for class_name, subc in inspect.getmembers(module, inspect.isclass):
                     if (
-                        inspect.isclass(subc)
+                        subc not in seen
+                        and inspect.isclass(subc)
                         and issubclass(subc, iface)
                         and subc != iface
                         and (subc.__module__ == module.__name__)
@@ -279,16 +374,39 @@ class Bootstrap:
                         if excluding and issubclass(subc, excluding):
                             pass
                         else:
+                            seen.add(subc)
                             result.append(subc)
             except ImportError as err:
-                Bootstrap.logger().error(f"Cannot get members of {module}: {err}")
+                Bootstrap.error(f"Cannot get members of {module}: {err}")
                 pass
 
         return result
 
+    @staticmethod
+    def _all_subclasses(cls) -> List:
+        """
+        Retrieves all subclasses of given class, traversing the hierarchy breadth-first.
+        :param cls: The class.
+        :type cls: type
+        :return: The subclasses, direct or not.
+        :rtype: List
+        """
+        result = []
+        seen = set()
+        pending = deque([cls])
+        while pending:
+            for subclass in pending.popleft().__subclasses__():
+                if subclass not in seen:
+                    seen.add(subclass)
+                    result.append(subclass)
+                    pending.append(subclass)
+        return result
+
     def get_adapters(self, interface, modules: List):
         """
         Retrieves the implementations for given interface.
+        Python already keeps track of the subclasses of the interface, so we
+        only check which of them are exposed by given modules.
         :param interface: The interface.
         :type interface: Object
         :param modules: The modules to inspect.
@@ -297,24 +415,127 @@ class Bootstrap:
         :rtype: List
         """
         result = []
+        seen = set()
 
         import abc
 
+        candidates = [
+            subclass
+            for subclass in self._all_subclasses(interface)
+            if abc.ABC not in subclass.__bases__
+        ]
+
         for module in modules:
-            try:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", category=DeprecationWarning)
-                    for class_name, inst in inspect.getmembers(module, inspect.isclass):
-                        if (
-                            (inspect.isclass(inst))
-                            and (issubclass(inst, interface))
-                            and (inst != interface)
-                            and (abc.ABC not in inst.__bases__)
-                            and not inst in result
-                        ):
-                            result.append(inst)
-            except ImportError as err:
-                Bootstrap.logger().error(f"Error importing {module}: {err}")
+            members = getattr(module, "__dict__", {})
+            for inst in sorted(
+                (
+                    candidate
+                    for candidate in candidates
+                    if candidate not in seen
+                    and members.get(candidate.__name__) is candidate
+                ),
+                key=lambda candidate: candidate.__name__,
+            ):
+                seen.add(inst)
+                result.append(inst)
+
+        return result
+
+    @staticmethod
+    def _walk_packages(paths: List, prefix: str, recursive: bool = True):
+        """
+        Walks the modules and packages under given paths, without importing them.
+        Only regular packages (folders with an __init__ module) are considered.
+        Symlinked folders are followed, visiting each real folder only once.
+        :param paths: The paths of the package (its __path__).
+        :type paths: List[str]
+        :param prefix: The prefix of the module names.
+        :type prefix: str
+        :param recursive: Whether to descend into subpackages.
+        :type recursive: bool
+        :return: A generator of (module name, whether it's a package) tuples.
+        :rtype: Generator[Tuple[str, bool]]
+        """
+        visited = set()
+        for path in paths:
+            for root, dirs, files in os.walk(path, followlinks=True):
+                real_root = os.path.realpath(root)
+                if real_root in visited:
+                    dirs[:] = []
+                    continue
+                visited.add(real_root)
+                relative = os.path.relpath(root, path)
+                if relative == ".":
+                    root_prefix = prefix
+                else:
+                    root_prefix = prefix + relative.replace(os.sep, ".") + "."
+                dirs[:] = sorted(
+                    d
+                    for d in dirs
+                    if d.isidentifier()
+                    and Bootstrap._is_package_folder(os.path.join(root, d))
+                )
+                modules = {}
+                for file in sorted(files):
+                    name = inspect.getmodulename(file)
+                    if name and name != "__init__" and name.isidentifier():
+                        modules.setdefault(name, None)
+                for name in modules:
+                    yield root_prefix + name, False
+                for dir in dirs:
+                    yield root_prefix + dir, True
+                if not recursive:
+                    dirs[:] = []
+
+    @staticmethod
+    def _is_package_folder(folder: str) -> bool:
+        """
+        Checks whether given folder is a regular package, i.e. it includes an
+        __init__ module with any of the supported suffixes (.py, .pyc, extensions).
+        :param folder: The folder.
+        :type folder: str
+        :return: True in such case.
+        :rtype: bool
+        """
+        if os.path.isfile(os.path.join(folder, "__init__.py")):
+            return True
+        try:
+            return any(
+                inspect.getmodulename(entry) == "__init__"
+                for entry in os.listdir(folder)
+            )
+        except OSError:
+            return False
+
+    def build_adapter_index(self, interfaces: List, modules: List) -> Dict:
+        """
+        Retrieves the implementations of all given interfaces, inspecting each module only once.
+        :param interfaces: The interfaces.
+        :type interfaces: List
+        :param modules: The modules to inspect.
+        :type modules: List[builtins.module]
+        :return: The implementations of each interface, as get_adapters would return them.
+        :rtype: Dict[type, List]
+        """
+        result = {}
+        seen = {}
+
+        import abc
+
+        targets = set(interfaces)
+
+        for module in modules:
+            members = getattr(module, "__dict__", {})
+            for name in sorted(members):
+                inst = members[name]
+                if not inspect.isclass(inst) or abc.ABC in inst.__bases__:
+                    continue
+                for base in inst.__mro__[1:]:
+                    if base in targets:
+                        adapters_seen = seen.setdefault(base, set())
+                        if inst not in adapters_seen:
+                            adapters_seen.add(inst)
+                            result.setdefault(base, []).append(inst)
 
         return result
 
@@ -336,26 +557,18 @@ class Bootstrap:
         if type is None or (
             package is not None and self.is_of_type(package.__path__[0], type)
         ):
-            for loader, name, is_pkg in pkgutil.walk_packages(
-                package.__path__, package.__name__ + "."
+            for name, is_pkg in self._walk_packages(
+                package.__path__, package.__name__ + ".", recursive
             ):
                 if not name.split(".")[-1].startswith("_"):
                     try:
                         # results[full_name] = __import__(name, fromlist=[""])
                         results[name] = self.import_package(name)
-                        if recursive and is_pkg:
-                            # child_package = __import__(name, fromlist=[""])
-                            child_package = self.import_package(name)
-                            results.update(
-                                self.import_submodules(child_package, None, recursive)
-                            )  # type is not considered for descendants.
                     except ImportError as err:
-                        if (
-                            not ".grpc." in name
-                            and not ".logging." in name
-                            and not ".git."
+                        if not any(
+                            fragment in name for fragment in _IGNORED_PATH_FRAGMENTS
                         ):
-                            Bootstrap.logger().error(
+                            Bootstrap.error(
                                 f"Error importing {name}: {err} while loading {package.__path__}"
                             )
         return results
@@ -363,6 +576,7 @@ class Bootstrap:
     def import_package(self, packageName: str) -> str:
         """
         Imports given package.
+        Import errors are left to the caller, which decides whether to report them.
         :param packageName: The name of the package.
         :type packageName: str
         :return: The path, or None if not found.
@@ -374,13 +588,17 @@ class Bootstrap:
             else:
                 # package = __import__(packageName, fromlist=[""])
                 package = importlib.import_module(packageName)
-                return importlib.reload(package)
+                if os.environ.get("PYTHONEDA_FORCE_RELOAD"):
+                    package = importlib.reload(package)
+                return package
+        except ImportError:
+            raise
         except Exception as err:
-            Bootstrap.logger().error(f"Cannot import package {packageName}: {err}")
+            Bootstrap.error(f"Cannot import package {packageName}: {err}")
             import traceback
 
             traceback.print_exc()
-            Bootstrap.logger().error("")
+            Bootstrap.error("")
 
             return None
 
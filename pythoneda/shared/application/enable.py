@@ -19,7 +19,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import importlib
 import inspect
 from .pythoneda import PythonEDA
 from typing import Dict, Tuple
@@ -28,7 +27,7 @@ from typing import Dict, Tuple
 def enable(adapterClsOrInstance, *args: Tuple, **kwargs: Dict):
     """
     Decorator that enables an adapter class or instance.
-    If you pass a class, we import the module and call adapterCls.enable(*args, **kwargs).
+    If you pass a class, we retrieve its (already imported) module and call adapterCls.enable(*args, **kwargs).
     If you pass an instance, we add it to the enabled infrastructure adapters.
     :param adapterClsOrInstance: The adapter class or instance to enable.
     :type adapterClsOrInstance: Type or object
@@ -42,10 +41,10 @@ def enable(adapterClsOrInstance, *args: Tuple, **kwargs: Dict):
     def decorator(cls):
         if inspect.isclass(adapterClsOrInstance):
             adapterCls = adapterClsOrInstance
-            module = importlib.import_module(adapterCls.__module__)
-            if module not in PythonEDA.enabled_infrastructure_modules:
+            module = PythonEDA.get_module(adapterCls.__module__)
+            if not PythonEDA.is_infrastructure_module_enabled(module.__name__):
                 adapterCls.enable(*args, **kwargs)
-                PythonEDA.enabled_infrastructure_modules.append(module)
+                PythonEDA.enable_infrastructure_module(module)
         else:
             adapterInstance = adapterClsOrInstance
             PythonEDA.enabled_infrastructure_adapters.append(adapterInstance)
@@ -20,22 +20,110 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from .bootstrap import Bootstrap
+from .pythoneda_finder import PythonEDAFinder
+import asyncio
+from collections import deque
 from collections.abc import Iterable
 
 # from eventsourcing.application import Application
+import functools
 import importlib
+import importlib.metadata
 import inspect
+from itertools import groupby
 import logging
+from operator import attrgetter, itemgetter
 import os
-from pathlib import Path
 import pkgutil
-from pythoneda.shared import Invariant, Invariants, PythonedaApplication
-from pythoneda.shared.banner import Banner
-from pythoneda.shared.infrastructure.cli import LoggingConfigCli
-from pythoneda.shared.infrastructure.logging import LoggingAdapter
+from pythoneda.shared import (
+    EventEmitter,
+    EventListener,
+    Invariant,
+    Invariants,
+    Ports,
+    PrimaryPort,
+    PythonedaApplication,
+)
 import sys
-from typing import Callable, Dict, List, Tuple, Type
-import warnings
+from typing import Callable, Dict, List, Set, Tuple, Type
+
+
+_INIT = "__init__.py"
+_ROOT_SHARED_FILES = frozenset({_INIT, "event.py", "port.py"})
+_SHARED_FOLDER = os.path.join("pythoneda", "shared")
+
+_EVENTSOURCING_SETTINGS = (
+    "PERSISTENCE_MODULE",
+    "EVENTSTOREDB_URI",
+    "EVENTSTOREDB_ROOT_CERTIFICATES",
+    "SQLITE_DBNAME",
+)
+
+_LOGGING_CONFIG_MODULE = sys.intern(
+    "pythoneda.shared.infrastructure.logging.logging_config"
+)
+_get_configure_logging = attrgetter("configure_logging")
+
+_LAZY_ATTRIBUTES = {
+    "Banner": "pythoneda.shared.banner",
+    "LoggingAdapter": "pythoneda.shared.infrastructure.logging",
+    "LoggingConfigCli": "pythoneda.shared.infrastructure.cli",
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports the infrastructure classes this module used to import eagerly, on first access.
+    :param name: The attribute name.
+    :type name: str
+    :return: The attribute.
+    :rtype: object
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module_name), name)
+    globals()[name] = result
+    return result
+
+
+def _cached_import(name: str):
+    """
+    Imports given module, unless it's already loaded.
+    :param name: The module name.
+    :type name: str
+    :return: The module.
+    :rtype: builtins.module
+    """
+    result = sys.modules.get(name, None)
+    if result is None:
+        result = importlib.import_module(name)
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _load_es_bases() -> Tuple:
+    """
+    Resolves the classes involved in enabling event sourcing, once.
+    :return: A tuple consisting of (Entity, Event, ValueObject, Aggregate).
+    :rtype: Tuple[type, type, type, type]
+    """
+    from pythoneda.shared import Entity, Event, ValueObject
+    from eventsourcing.domain import Aggregate
+
+    return Entity, Event, ValueObject, Aggregate
+
+
+@functools.lru_cache(maxsize=None)
+def _init_signature(cls: Type) -> inspect.Signature:
+    """
+    Retrieves the signature of the constructor of given class.
+    :param cls: The class.
+    :type cls: type
+    :return: Such signature.
+    :rtype: inspect.Signature
+    """
+    return inspect.signature(cls.__init__)
 
 
 class PythonEDA(PythonedaApplication):
@@ -56,10 +144,28 @@ class PythonEDA(PythonedaApplication):
     """
 
     _singleton = None
-    _enabled_infrastructure_modules = []
+    _enabled_infrastructure_modules = {}
     _enabled_infrastructure_adapters = []
     _logging_configured = False
-    _pending_logging = []
+    _pending_logging = deque(maxlen=10000)
+    _dropped_pending_logging = 0
+    _root_path_cache = None
+    _has_default_constructor_cache = {}
+    _has_constructor_with_app_argument_cache = {}
+    _has_class_method_cache = {}
+    _priorities = {}
+    _recursively_loaded = set()
+    _recursively_loaded_origins = set()
+    _cached_event_emitters = None
+    _finder = None
+    _logging_modules = None
+    _debug_enabled = True
+    _full_class_names = {}
+    _application_packages = {}
+    _log_config = None
+    _logging_config_module = None
+    _log_config_resolved = False
+    _eventsourcing_applied = False
 
     def __init__(self, name: str, banner=None, file=__file__):
         """
@@ -73,7 +179,9 @@ class PythonEDA(PythonedaApplication):
         """
         super().__init__(name)
         self._primary_ports = []
+        self._sorted_primary_ports = []
         self._banner = banner
+        self._namespace_roots = None
         self.fix_syspath(file)
         self.sort_pythoneda_package_in_sys_path()
         self.load_all_packages()
@@ -82,7 +190,8 @@ class PythonEDA(PythonedaApplication):
             self._domain_modules,
             self._infrastructure_packages,
         ) = self.load_bounded_context()
-        self._domain_ports = self.find_domain_ports(self._domain_modules)
+        # computed on first access
+        self._domain_ports = None
         self._one_shot = False
         self.initialize()
 
@@ -97,13 +206,54 @@ class PythonEDA(PythonedaApplication):
 
     @classmethod
     @property
-    def enabled_infrastructure_modules(cls) -> List:
+    def enabled_infrastructure_modules(cls) -> Iterable:
         """
-        Retrieves the enabled infrastructure modules.
-        :return: Such list.
-        :rtype: List
+        Retrieves the enabled infrastructure modules, in the order they were enabled.
+        Use enable_infrastructure_module() to add new ones.
+        :return: Such modules.
+        :rtype: collections.abc.ValuesView
+        """
+        return cls._enabled_infrastructure_modules.values()
+
+    @classmethod
+    def get_module(cls, name: str):
+        """
+        Retrieves given module, importing it if it's not loaded yet.
+        :param name: The module name.
+        :type name: str
+        :return: The module.
+        :rtype: builtins.module
+        """
+        return _cached_import(name)
+
+    @classmethod
+    def is_infrastructure_module_enabled(cls, name: str) -> bool:
+        """
+        Checks whether given infrastructure module is enabled already.
+        :param name: The name of the module.
+        :type name: str
+        :return: True in such case.
+        :rtype: bool
+        """
+        return name in cls._enabled_infrastructure_modules
+
+    @classmethod
+    def enable_infrastructure_module(cls, module) -> bool:
+        """
+        Enables given infrastructure module, unless it's enabled already.
+        :param module: The module.
+        :type module: builtins.module
+        :return: True if the module wasn't enabled before.
+        :rtype: bool
         """
-        return cls._enabled_infrastructure_modules
+        if cls.is_infrastructure_module_enabled(module.__name__):
+            return False
+        PythonEDA._enabled_infrastructure_modules[module.__name__] = module
+        if module.__name__ == _LOGGING_CONFIG_MODULE:
+            PythonEDA._logging_config_module = module
+            # the logging configuration comes from the new module
+            PythonEDA._log_config_resolved = False
+        return True
 
     @classmethod
     @property
@@ -137,9 +287,12 @@ class PythonEDA(PythonedaApplication):
     def domain_ports(self) -> List:
         """
         Retrieves the port interfaces.
+        They are looked for in the domain modules the first time they are needed.
         :return: Such interfaces.
         :rtype: List
         """
+        if self._domain_ports is None:
+            self._domain_ports = self.find_domain_ports(self._domain_modules)
         return self._domain_ports
 
     @property
@@ -160,6 +313,15 @@ class PythonEDA(PythonedaApplication):
         """
         return self._primary_ports
 
+    @property
+    def sorted_primary_ports(self) -> List:
+        """
+        Retrieves the primary ports found, sorted by priority.
+        :return: Such ports.
+        :rtype: List
+        """
+        return self._sorted_primary_ports
+
     @property
     def banner(self):
         """
@@ -192,9 +354,18 @@ class PythonEDA(PythonedaApplication):
         Sorts sys.path so that the pythoneda package is provided by the actual root package.
         """
         root_module = self.find_actual_root_pythoneda_package_path()
+        if root_module is None:
+            return
         root = os.path.dirname(root_module)
-        sys.path.remove(root)
+        if sys.path and sys.path[0] == root:
+            return
+        try:
+            sys.path.remove(root)
+        except ValueError:
+            pass
         sys.path.insert(0, root)
+        # moving the root first doesn't change it, so the cache stays valid
+        PythonEDA._root_path_cache = (tuple(sys.path), root_module)
 
     def fix_syspath(self, file: str):
         """
@@ -203,20 +374,22 @@ class PythonEDA(PythonedaApplication):
         :param file: The file where this specific instance is defined.
         :type file: str
         """
+        paths_to_keep = []
         paths_to_add = []
-        paths_to_remove = []
 
         for path in sys.path:
             root_path = self.find_root_of(path)
-            if root_path != path:
-                paths_to_remove.append(path)
-                paths_to_add.append(root_path)
+            if root_path == path:
+                paths_to_keep.append(path)
+            else:
+                paths_to_add.append(os.path.abspath(root_path))
 
-        for path_to_remove in paths_to_remove:
-            sys.path.remove(os.path.abspath(path_to_remove))
+        if not paths_to_add and len(set(paths_to_keep)) == len(paths_to_keep):
+            # nothing to fix
+            return
 
-        for path_to_add in paths_to_add:
-            sys.path.append(os.path.abspath(path_to_add))
+        # dict keys keep the order while removing duplicates
+        sys.path[:] = list(dict.fromkeys(paths_to_keep + paths_to_add))
 
     def from_pythoneda(self, pkg) -> bool:
         """
@@ -226,68 +399,135 @@ class PythonEDA(PythonedaApplication):
         :return: True in such case.
         :rtype: bool
         """
-        if pkg.__name__ == "pythoneda":
-            result = True
-        elif pkg.__name__ == "" or pkg.__name__ == pkg.__package__:
-            result = False
-        else:
-            result = False
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=DeprecationWarning)
+        name = getattr(pkg, "__name__", "")
+        return name == "pythoneda" or name.startswith("pythoneda.")
+
+    def load_all_packages(self):
+        """
+        Loads all packages.
+        Only the packages advertising PythonEDA entry points get loaded. The
+        rest of the PythonEDA packages are just indexed here, and imported
+        when loading the bounded context.
+        """
+        self.load_entry_point_packages()
+        self.install_finder(self.index_namespace_roots())
+
+        # plain modules already imported have nothing left to load, so they
+        # are not visited again; packages still get their submodules listed
+        PythonEDA._recursively_loaded.update(
+            name
+            for name, module in list(sys.modules.items())
+            if name.startswith("pythoneda.")
+            and module is not None
+            and not hasattr(module, "__path__")
+        )
+        self.load_module_recursive("pythoneda")
+
+    @classmethod
+    def install_finder(cls, namespaceRoots: Dict):
+        """
+        Installs a finder for the modules under given namespaces, replacing the previous one.
+        :param namespaceRoots: The namespaces and the sys.path entries providing them.
+        :type namespaceRoots: Dict[str, List[str]]
+        """
+        finder = PythonEDAFinder(namespaceRoots)
+        previous = PythonEDA._finder
+        if previous is not None and previous in sys.meta_path:
+            sys.meta_path.remove(previous)
+        sys.meta_path.insert(0, finder)
+        PythonEDA._finder = finder
+
+    def load_entry_point_packages(self):
+        """
+        Loads the packages declared under the PythonEDA entry-point groups.
+        """
+        for group in ["pythoneda.domain", "pythoneda.infrastructure"]:
+            for entry_point in importlib.metadata.entry_points(group=group):
                 try:
-                    result = self.from_pythoneda(
-                        # Bootstrap.instance().import_package(pkg.__package__)
-                        importlib.import_module(pkg.__package__)
-                    )
-                except ModuleNotFoundError as err:
+                    entry_point.load()
+                except Exception as err:
                     PythonEDA.log_error(
-                        f"Cannot import pythoneda package {pkg.__package__}: {err}"
+                        f"Cannot load entry point {entry_point.value} ({group}): {err}"
                     )
-        return result
 
-    def load_all_packages(self):
+    def index_namespace_roots(self) -> Dict:
         """
-        Loads all packages.
+        Finds the sys.path entries providing the pythoneda namespace, or any
+        of the extra namespaces, without importing anything.
+        :return: A dictionary of namespaces and the paths providing them.
+        :rtype: Dict[str, List[str]]
         """
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=DeprecationWarning)
-            for importer, pkg, ispkg in pkgutil.iter_modules():
-                if (
-                    ispkg
-                    and pkg
-                    not in {"pythoneda", "asyncio", "tkinter", "matplotlib_inline"}
-                    and pkg not in sys.modules
-                ):
-                    # Use find_spec instead of find_module
-                    spec = importer.find_spec(pkg)
-                    if spec is None:
-                        PythonEDA.log_error(f"Spec is none for {pkg}")
-                    else:
-                        try:
-                            # Load the module using the spec
-                            module = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(module)
-                        except Exception as err:
-                            PythonEDA.log_error(
-                                f"Cannot import package {pkg}/{type(pkg)}: {err}"
-                            )
+        namespaces = {"pythoneda"}
+        extra_namespaces = os.environ.get("PYTHONEDA_EXTRA_NAMESPACES")
+        if extra_namespaces is not None:
+            namespaces.update(extra_namespaces.split(":"))
 
-        self.load_module_recursive("pythoneda")
+        result = {}
+        for path in sys.path:
+            if not os.path.isdir(path):
+                continue
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if (
+                            entry.name in namespaces
+                            and entry.is_dir()
+                            and os.path.isfile(os.path.join(entry.path, _INIT))
+                        ):
+                            result.setdefault(entry.name, []).append(path)
+            except OSError as err:
+                PythonEDA.log_error(f"Cannot read {path}: {err}")
+
+        self._namespace_roots = result
+        return result
+
+    def namespace_roots(self, namespace: str) -> List:
+        """
+        Retrieves the sys.path entries providing given namespace.
+        :param namespace: The namespace.
+        :type namespace: str
+        :return: Such paths.
+        :rtype: List[str]
+        """
+        if self._namespace_roots is None or namespace not in self._namespace_roots:
+            self.index_namespace_roots()
+        return self._namespace_roots.get(namespace, [])
 
     def load_module_recursive(self, name):
         """
         Loads given module, recursively.
+        Modules already loaded this way, in this process, are skipped, even if
+        reached under a different name (e.g. through another namespace).
+        :param name: The module name.
+        :type name: str
         """
+        if name in PythonEDA._recursively_loaded:
+            return
         try:
             # Try to load the module/package
             #            module = Bootstrap.instance().import_package(name)
-            module = __import__(name, fromlist=[""])
+            module = _cached_import(name)
+
+            # the same file can be reachable under more than one name
+            origin = getattr(getattr(module, "__spec__", None), "origin", None)
+            if origin is not None:
+                if origin in PythonEDA._recursively_loaded_origins:
+                    PythonEDA._recursively_loaded.add(name)
+                    return
+                PythonEDA._recursively_loaded_origins.add(origin)
 
             # If it's a package, discover its submodules and load them
-            if pkgutil.get_loader(name).is_package(name):
-                pkg_path = module.__path__
+            pkg_path = getattr(module, "__path__", None)
+            if pkg_path is not None:
+                # local bindings, since they are used for every submodule
+                loaded = PythonEDA._recursively_loaded
+                load_module_recursive = self.load_module_recursive
                 for _, mod_name, ispkg in pkgutil.iter_modules(pkg_path):
-                    self.load_module_recursive(f"{name}.{mod_name}")
+                    submodule_name = f"{name}.{mod_name}"
+                    if submodule_name not in loaded:
+                        load_module_recursive(submodule_name)
+
+            PythonEDA._recursively_loaded.add(name)
 
         except ImportError as err:
             PythonEDA.log_error(f"Cannot import module {name}: {err}")
@@ -295,8 +535,17 @@ class PythonEDA(PythonedaApplication):
             PythonEDA.log_error(f"Cannot import module {name}: {err}")
 
     @staticmethod
-    def custom_sort(item):
-        split_item = item.split(".")
+    def custom_sort(item: str) -> Tuple:
+        """
+        Sort key for dotted names: shallower names first, then by their parts.
+        Meant to be used as key function (sorted(names, key=PythonEDA.custom_sort)),
+        which computes it once per item rather than once per comparison.
+        :param item: The dotted name.
+        :type item: str
+        :return: The sort key.
+        :rtype: Tuple[int, Tuple[str]]
+        """
+        split_item = tuple(item.split("."))
         return len(split_item), split_item
 
     def is_empty_namespace_folder(self, directory: str) -> bool:
@@ -308,68 +557,133 @@ class PythonEDA(PythonedaApplication):
         :rtype: bool
         """
         has_init = False
-        has_other_py_files = False
         has_subfolders = False
 
-        # List the contents of the directory
-        for name in os.listdir(directory):
-            path = os.path.join(directory, name)
-
-            # Check if the file is __init__.py
-            if os.path.isfile(path) and name == "__init__.py":
-                has_init = True
-
-            # Check if the file is not __init__.py
-            if os.path.isfile(path) and name != "__init__.py" and name.endswith(".py"):
-                has_other_py_files = True
+        # List the contents of the directory, reusing the cached entry types
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if entry.name == _INIT:
+                        has_init = True
+                    elif entry.name.endswith(".py"):
+                        # __init__.py must be the only py file
+                        return False
+                elif entry.is_dir():
+                    has_subfolders = True
+
+        # Condition to make sure there are subdirectories as well
+        return has_init and has_subfolders
 
-            # Check if there are subdirectories
-            if os.path.isdir(path):
-                has_subfolders = True
-
-        # Condition to make sure __init__.py is the only py file and there are subdirectories
-        return has_init and has_subfolders and not has_other_py_files
+    @staticmethod
+    def is_root_pythoneda_shared_folder(folder: str) -> bool:
+        """
+        Checks if given folder is the actual pythoneda/shared package.
+        :param folder: The folder.
+        :type folder: str
+        :return: True in such case.
+        :rtype: bool
+        """
+        # a missing folder is detected by scandir itself, without a stat call
+        try:
+            with os.scandir(folder) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return False
+        return _ROOT_SHARED_FILES <= names
 
     @staticmethod
     def find_actual_root_pythoneda_package_path() -> str:
         """
         Retrieves the path of the actual root Pythoneda package.
+        The result is cached until sys.path changes.
         :return: Such package.
         :rtype: str
         """
+        key = tuple(sys.path)
+        cached = PythonEDA._root_path_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         result = None
         for path in sys.path:
-            init_file = Path(path) / "pythoneda" / "shared" / Path("__init__.py")
-            event_file = Path(path) / "pythoneda" / "shared" / Path("event.py")
-            port_file = Path(path) / "pythoneda" / "shared" / Path("port.py")
-            if (
-                os.path.exists(init_file)
-                and os.path.exists(event_file)
-                and os.path.exists(port_file)
+            if PythonEDA.is_root_pythoneda_shared_folder(
+                os.path.join(path, _SHARED_FOLDER)
             ):
-                result = str(Path(path) / "pythoneda")
+                result = os.path.join(path, "pythoneda")
                 break
+
+        PythonEDA._root_path_cache = (key, result)
         return result
 
-    def find_root_of(self, path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def find_root_of(path: str) -> str:
         """
-        Traverses the parents of given path until it reaches the "site-packages".
+        Finds the closest "site-packages" ancestor of given path.
+        Results are cached, since it depends on the path alone.
         :param path: The path.
         :type path: str
         :return: The root path.
         :rtype: str
         """
-        working_path = path
-        while True:
-            if os.path.basename(working_path) == "site-packages":
-                return os.path.abspath(working_path)
-
-            parent = os.path.dirname(working_path)
+        # the closest "site-packages" ancestor is its last occurrence as a
+        # whole path component, found without walking the parents
+        index = f"{os.sep}{path}{os.sep}".rfind(f"{os.sep}site-packages{os.sep}")
+        if index == -1:
+            return path
 
-            if parent == working_path:
-                return path
+        return os.path.abspath(path[: index + len("site-packages")])
 
-            working_path = parent
+    @classmethod
+    def scan_packages(
+        cls, folder: str, packageName: str, result: Dict, visited: Set = None
+    ):
+        """
+        Collects the regular packages under given folder, recursively.
+        Folders without an __init__.py file are pruned right away.
+        :param folder: The folder.
+        :type folder: str
+        :param packageName: The name of the package of such folder.
+        :type packageName: str
+        :param result: The dictionary of package names and paths to update.
+        :type result: Dict[str, str]
+        :param visited: The real paths already scanned, to stop at symlink cycles.
+        :type visited: Set[str]
+        """
+        if visited is None:
+            visited = set()
+        real_folder = os.path.realpath(folder)
+        if real_folder in visited:
+            return
+        visited.add(real_folder)
+        subfolders = []
+        is_package = False
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        if (
+                            name != "__pycache__"
+                            and ".dist-info" not in name
+                            and not name.startswith(".")
+                        ):
+                            subfolders.append(entry)
+                    elif name == _INIT:
+                        is_package = True
+        except OSError:
+            return
+
+        if not is_package:
+            return
+
+        if not result.get(packageName, False):
+            result[packageName] = folder
+
+        for entry in subfolders:
+            cls.scan_packages(
+                entry.path, f"{packageName}.{entry.name}", result, visited
+            )
 
     def get_path_of_packages_under_namespace(self, namespace: str) -> Dict:
         """
@@ -381,32 +695,8 @@ class PythonEDA(PythonedaApplication):
         """
         result = {}
 
-        for path in sys.path:
-            init_file = Path(path) / namespace / Path("__init__.py")
-            if os.path.exists(init_file):
-                # walk through all files and directories in site-packages
-                for root, dirs, _ in os.walk(path):
-                    if ".dist-info" in root:
-                        continue
-                    # only consider directories
-                    for dir in dirs:
-                        if dir == "__pycache__" or ".dist-info" in dir:
-                            continue
-                        # construct the full path
-                        full_path = os.path.join(root, dir)
-
-                        # if this directory is a package
-                        if os.path.isfile(os.path.join(full_path, "__init__.py")):
-                            # get the package name
-                            package_name = full_path[len(path) + 1 :].replace(
-                                os.sep, "."
-                            )
-
-                            # if the package is a sub-package of the namespace
-                            if package_name.startswith(namespace) and not result.get(
-                                package_name, False
-                            ):
-                                result[package_name] = full_path
+        for path in self.namespace_roots(namespace):
+            self.scan_packages(os.path.join(path, namespace), namespace, result)
 
         result["pythoneda"] = self.find_actual_root_pythoneda_package_path()
 
@@ -418,28 +708,20 @@ class PythonEDA(PythonedaApplication):
         :return: A tuple consisting of (domain packages, domain modules, infrastructure packages).
         :rtype: Tuple[List, List, List]
         """
-        (
-            domain_packages,
-            domain_modules,
-            infrastructure_packages,
-        ) = self.load_packages_under("pythoneda")
+        # dicts keep the first occurrence of each item, in order
+        accumulated = tuple(
+            dict.fromkeys(items) for items in self.load_packages_under("pythoneda")
+        )
         extra_namespaces = os.environ.get("PYTHONEDA_EXTRA_NAMESPACES")
         if extra_namespaces is not None:
             for namespace in extra_namespaces.split(":"):
-                (
-                    extra_domain_packages,
-                    extra_domain_modules,
-                    extra_infrastructure_packages,
-                ) = self.load_packages_under(namespace)
-                self.__class__.extend_missing_items(
-                    domain_packages, extra_domain_packages
-                )
-                self.__class__.extend_missing_items(
-                    domain_modules, extra_domain_modules
-                )
-                self.__class__.extend_missing_items(
-                    infrastructure_packages, extra_infrastructure_packages
-                )
+                for known, items in zip(
+                    accumulated, self.load_packages_under(namespace)
+                ):
+                    known.update(dict.fromkeys(items))
+        domain_packages, domain_modules, infrastructure_packages = (
+            list(known) for known in accumulated
+        )
         self.log_debug_packages("Infrastructure packages:", infrastructure_packages)
         return domain_packages, domain_modules, infrastructure_packages
 
@@ -468,47 +750,72 @@ class PythonEDA(PythonedaApplication):
         :rtype: tuple
         """
 
-        domain_packages = []
-        domain_modules = []
-        infrastructure_packages = []
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=DeprecationWarning)
-            packages = self.get_path_of_packages_under_namespace(namespace)
-            from pythoneda.shared.artifact import HexagonalLayer
+        domain_packages = {}
+        domain_modules_by_name = {}
+        infrastructure_packages = {}
+        packages = self.get_path_of_packages_under_namespace(namespace)
+
+        for package_name, package_path in packages.items():
+            classification = self.classify_package(package_name, package_path)
+            if classification is None:
+                continue
+            (
+                package_path,
+                domain_package,
+                infrastructure_package,
+                submodules,
+            ) = classification
+            if domain_package and package_path not in domain_packages:
+                domain_packages[package_path] = None
+                PythonEDA.log_debug(f"Found domain package {package_path}")
+                domain_modules_by_name.update(submodules)
+            if infrastructure_package:
+                infrastructure_packages[package_path] = None
+
+        return (
+            list(domain_packages),
+            list(domain_modules_by_name.values()),
+            list(infrastructure_packages),
+        )
 
-            for package_name in packages:
-                try:
-                    # package = Bootstrap.instance().import_package(package_name)
-                    package = __import__(package_name, fromlist=[""])
-                    package = importlib.reload(package)
-                    package_path = packages[package_name]
-                    domain_package = Bootstrap.instance().is_domain_package(
-                        package_path
-                    )
-                    infrastructure_package = (
-                        Bootstrap.instance().is_infrastructure_package(package_path)
-                    )
-                    if domain_package and package_path not in domain_packages:
-                        domain_packages.append(package_path)
-                        PythonEDA.log_debug(f"Found domain package {package_path}")
-                        submodules = Bootstrap.instance().import_submodules(
-                            package, HexagonalLayer.DOMAIN, True
-                        )
-                        self.__class__.extend_missing_items(
-                            domain_modules, submodules.values()
-                        )
-                    if (
-                        infrastructure_package
-                        and package_path not in infrastructure_packages
-                    ):
-                        infrastructure_packages.append(package_path)
-                except Exception as err:
-                    PythonEDA.log_error(f"Cannot import package {package_name}: {err}")
-                    import traceback
+    def classify_package(self, packageName: str, packagePath: str) -> Tuple:
+        """
+        Checks whether given package belongs to the domain or the infrastructure layers.
+        The layer markers are files, so packages belonging to neither are not imported.
+        Domain packages get their submodules imported as well.
+        :param packageName: The name of the package.
+        :type packageName: str
+        :param packagePath: The path of the package.
+        :type packagePath: str
+        :return: A tuple consisting of (package path, whether it's a domain package, whether it's an infrastructure package, domain submodules), or None if it cannot be imported.
+        :rtype: Tuple[str, bool, bool, Dict[str, builtins.module]]
+        """
+        from pythoneda.shared.artifact import HexagonalLayer
 
-                    traceback.print_exc()
+        try:
+            layers = Bootstrap.instance().classify_package(packagePath)
+            domain_package = HexagonalLayer.DOMAIN in layers
+            infrastructure_package = HexagonalLayer.INFRASTRUCTURE in layers
+            submodules = {}
+            if not domain_package and not infrastructure_package:
+                return packagePath, domain_package, infrastructure_package, submodules
+
+            # package = Bootstrap.instance().import_package(packageName)
+            package = _cached_import(packageName)
+            if os.environ.get("PYTHONEDA_FORCE_RELOAD"):
+                package = importlib.reload(package)
+            if domain_package:
+                submodules = Bootstrap.instance().import_submodules(
+                    package, HexagonalLayer.DOMAIN, True
+                )
+            return packagePath, domain_package, infrastructure_package, submodules
+        except Exception as err:
+            PythonEDA.log_error(f"Cannot import package {packageName}: {err}")
+            import traceback
 
-        return domain_packages, domain_modules, infrastructure_packages
+            traceback.print_exc()
+
+        return None
 
     def find_domain_ports(self, modules: List) -> List:
         """
@@ -518,9 +825,8 @@ class PythonEDA(PythonedaApplication):
         :return: Such interfaces.
         :rtype: List
         """
-        result = []
+        result = {}
         from pythoneda.shared.port import Port
-        from pythoneda.shared.primary_port import PrimaryPort
 
         for module in modules:
             if module is not None:
@@ -530,45 +836,80 @@ class PythonEDA(PythonedaApplication):
                         Port, module, PrimaryPort
                     )
                     # print(f"Interfaces of {module}: {interfaces}")
-                    self.__class__.extend_missing_items(result, interfaces)
+                    for interface in interfaces:
+                        result.setdefault(id(interface), interface)
 
-        return result
+        return list(result.values())
 
     @classmethod
-    def log_debug(cls, message: str):
+    def log_debug(cls, message: str, *args):
         """
         Prints a debug message.
-        :param message: The message to log.
+        :param message: The message to log, optionally with %-style placeholders.
         :type message: str
+        :param args: The values of the placeholders, formatted only if the message gets logged.
+        :type args: Tuple
         """
         if cls._logging_configured:
-            cls.logger().debug(message)
+            cls.logger().debug(message, *args)
         else:
-            cls._pending_logging.append(("debug", message))
+            cls.buffer_log(logging.DEBUG, message % args if args else message)
 
     @classmethod
-    def log_info(cls, message: str):
+    def log_info(cls, message: str, *args):
         """
         Prints an info message.
-        :param message: The message to log.
+        :param message: The message to log, optionally with %-style placeholders.
         :type message: str
+        :param args: The values of the placeholders, formatted only if the message gets logged.
+        :type args: Tuple
         """
         if cls._logging_configured:
-            cls.logger().info(message)
+            cls.logger().info(message, *args)
         else:
-            cls._pending_logging.append(("info", message))
+            cls.buffer_log(logging.INFO, message % args if args else message)
 
     @classmethod
-    def log_error(cls, message: str):
+    def log_error(cls, message: str, *args):
         """
         Prints an info message.
-        :param message: The message to log.
+        :param message: The message to log, optionally with %-style placeholders.
         :type message: str
+        :param args: The values of the placeholders, formatted only if the message gets logged.
+        :type args: Tuple
         """
         if cls._logging_configured:
-            cls.logger().error(message)
+            cls.logger().error(message, *args)
         else:
-            cls._pending_logging.append(("error", message))
+            cls.buffer_log(logging.ERROR, message % args if args else message)
+
+    @classmethod
+    def buffer_log(cls, level: int, message: str):
+        """
+        Keeps given message until the logging system gets configured.
+        Once the buffer is full, the oldest messages are dropped, and counted.
+        :param level: The logging level.
+        :type level: int
+        :param message: The message.
+        :type message: str
+        """
+        pending = PythonEDA._pending_logging
+        if len(pending) == pending.maxlen:
+            PythonEDA._dropped_pending_logging += 1
+        pending.append((level, message))
+
+    @staticmethod
+    def use_eager_tasks():
+        """
+        Makes the running loop execute new tasks eagerly, when supported (Python 3.12+),
+        so coroutines completing without suspending don't get scheduled as tasks.
+        Custom task factories are respected.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            loop = asyncio.get_running_loop()
+            if loop.get_task_factory() is None:
+                loop.set_task_factory(eager_task_factory)
 
     @classmethod
     async def main(cls, name: str = None) -> PythonedaApplication:
@@ -577,6 +918,9 @@ class PythonEDA(PythonedaApplication):
         :param name: The application name.
         :type name: str
         """
+        # eager tasks change when tasks start running, so they're opt-in
+        if os.environ.get("PYTHONEDA_EAGER_TASKS"):
+            cls.use_eager_tasks()
         result = await cls.instance(name)
         await result.accept_input()
 
@@ -614,23 +958,14 @@ class PythonEDA(PythonedaApplication):
         """
         Initializes this instance.
         """
-        from pythoneda.shared.primary_port import PrimaryPort
+        from pythoneda.shared.infrastructure.cli import LoggingConfigCli
 
         mappings = {}
         if len(PythonEDA.enabled_infrastructure_modules) == 0:
             PythonEDA.log_error("No infrastructure modules enabled!\n")
         else:
-            PythonEDA.enabled_infrastructure_modules.append(
-                Bootstrap.instance().import_package(LoggingConfigCli.__module__)
-            )
-            PythonEDA.enabled_infrastructure_modules.append(
-                Bootstrap.instance().import_package(LoggingAdapter.__module__)
-            )
-            PythonEDA.enabled_infrastructure_modules.append(
-                Bootstrap.instance().import_package(
-                    "pythoneda.shared.infrastructure.logging.logging_config"
-                )
-            )
+            for module in PythonEDA.logging_modules():
+                PythonEDA.enable_infrastructure_module(module)
             LoggingConfigCli().entrypoint(self)
 
             aux = "\n".join([str(m) for m in PythonEDA.enabled_infrastructure_modules])
@@ -640,14 +975,20 @@ class PythonEDA(PythonedaApplication):
                 PrimaryPort, PythonEDA.enabled_infrastructure_modules
             )
             mappings[PrimaryPort] = self._primary_ports
+            self._sorted_primary_ports = sorted(
+                self._primary_ports, key=self.delegate_priority
+            )
             PythonEDA.log_debug(f"Domain ports: {self.domain_ports}")
+            adapter_index = Bootstrap.instance().build_adapter_index(
+                self.domain_ports, PythonEDA.enabled_infrastructure_modules
+            )
+            adapters_by_base = {}
+            for adapter in PythonEDA.enabled_infrastructure_adapters:
+                for base in type(adapter).__mro__:
+                    adapters_by_base.setdefault(base, []).append(adapter)
             for port in self.domain_ports:
-                implementations = Bootstrap.instance().get_adapters(
-                    port, PythonEDA.enabled_infrastructure_modules
-                )
-                for adapter in PythonEDA.enabled_infrastructure_adapters:
-                    if isinstance(adapter, port):
-                        implementations.append(adapter)
+                implementations = list(adapter_index.get(port, []))
+                implementations.extend(adapters_by_base.get(port, []))
 
                 if len(implementations) == 0:
                     if str(port.__module__) not in [
@@ -665,25 +1006,51 @@ class PythonEDA(PythonedaApplication):
                 else:
                     mappings[port] = implementations
 
-            from pythoneda.shared.ports import Ports
-
             PythonEDA.log_debug(f"Initializing ports with mappings: {mappings}")
             Ports.initialize(mappings)
+            PythonEDA.invalidate_event_emitter_cache()
 
             self.__class__._logging_configured = True
-            for level, message in self.__class__._pending_logging:
-                if level == "debug":
-                    PythonEDA.logger().debug(message)
-                elif level == "info":
-                    PythonEDA.logger().info(message)
-                elif level == "error":
-                    PythonEDA.logger().error(message)
-
-            from pythoneda.shared.event_listener import EventListener
-            from pythoneda.shared.event_emitter import EventEmitter
+            logger = PythonEDA.logger()
+            dropped = PythonEDA._dropped_pending_logging
+            if dropped > 0:
+                logger.warning(
+                    "%d earlier log messages were dropped before logging was configured",
+                    dropped,
+                )
+                PythonEDA._dropped_pending_logging = 0
+            # consecutive messages of the same level are logged at once
+            for level, entries in groupby(
+                self.__class__._pending_logging, key=itemgetter(0)
+            ):
+                logger.log(level, "\n".join(message for _, message in entries))
+            self.__class__._pending_logging.clear()
 
             EventEmitter.register_receiver(self)
 
+    @classmethod
+    def logging_modules(cls) -> List:
+        """
+        Retrieves the modules providing the logging infrastructure.
+        They are already imported, so they are taken from sys.modules, once.
+        :return: Such modules.
+        :rtype: List[builtins.module]
+        """
+        if PythonEDA._logging_modules is None:
+            from pythoneda.shared.infrastructure.cli import LoggingConfigCli
+            from pythoneda.shared.infrastructure.logging import LoggingAdapter
+
+            PythonEDA._logging_modules = [
+                _cached_import(name)
+                for name in (
+                    LoggingConfigCli.__module__,
+                    LoggingAdapter.__module__,
+                    _LOGGING_CONFIG_MODULE,
+                )
+            ]
+
+        return PythonEDA._logging_modules
+
     def get_primary_port_instance(self, primaryPort: Type):
         """
         Retrieves the primary port instance, if possible.
@@ -702,12 +1069,16 @@ class PythonEDA(PythonedaApplication):
         :return: Such priority.
         :rtype: int
         """
-        result = -1
-        if self.__class__.has_default_priority_class_method(primaryPort):
-            result = primaryPort.default_priority()
+        result = self.__class__._priorities.get(primaryPort, None)
+        if result is None:
+            result = -1
+            if self.__class__.has_default_priority_class_method(primaryPort):
+                result = primaryPort.default_priority()
+
+            if self.__class__.has_priority_class_method(primaryPort):
+                result = primaryPort.priority()
 
-        if self.__class__.has_priority_class_method(primaryPort):
-            result = primaryPort.priority()
+            self.__class__._priorities[primaryPort] = result
 
         return result
 
@@ -718,14 +1089,15 @@ class PythonEDA(PythonedaApplication):
         :param targetClass: The class to analyze.
         :type targetClass: type
         """
-        init_signature = inspect.signature(targetClass.__init__)
-
-        # Check if all parameters except 'self' have defaults
-        parameters = init_signature.parameters.values()
-        result = all(
-            p.default is not inspect.Parameter.empty or p.name == "self"
-            for p in parameters
-        )
+        result = cls._has_default_constructor_cache.get(targetClass, None)
+        if result is None:
+            # Check if all parameters except 'self' have defaults
+            parameters = _init_signature(targetClass).parameters.values()
+            result = all(
+                p.default is not inspect.Parameter.empty or p.name == "self"
+                for p in parameters
+            )
+            cls._has_default_constructor_cache[targetClass] = result
 
         return result
 
@@ -747,16 +1119,17 @@ class PythonEDA(PythonedaApplication):
         :param targetClass: The class to analyze.
         :type targetClass: type
         """
-        init_signature = inspect.signature(targetClass.__init__)
-
-        # Check if all parameters except 'self' or 'app' have defaults.
-        parameters = init_signature.parameters.values()
-        result = all(
-            p.default is not inspect.Parameter.empty
-            or p.name == "self"
-            or p.name == "app"
-            for p in parameters
-        )
+        result = cls._has_constructor_with_app_argument_cache.get(targetClass, None)
+        if result is None:
+            # Check if all parameters except 'self' or 'app' have defaults.
+            parameters = _init_signature(targetClass).parameters.values()
+            result = all(
+                p.default is not inspect.Parameter.empty
+                or p.name == "self"
+                or p.name == "app"
+                for p in parameters
+            )
+            cls._has_constructor_with_app_argument_cache[targetClass] = result
 
         return result
 
@@ -793,15 +1166,21 @@ class PythonEDA(PythonedaApplication):
         :return: True if the class defines that method.
         :rtype: bool
         """
-        return hasattr(targetClass, methodName) and callable(
-            getattr(targetClass, methodName)
-        )
+        key = (targetClass, methodName)
+        result = cls._has_class_method_cache.get(key, None)
+        if result is None:
+            result = callable(getattr(targetClass, methodName, None))
+            cls._has_class_method_cache[key] = result
+
+        return result
 
     async def accept_input(self):
         """
         Notification the application has been launched from the CLI.
         """
-        for primary_port in sorted(self.primary_ports, key=self.delegate_priority):
+        from pythoneda.shared.infrastructure.cli import LoggingConfigCli
+
+        for primary_port in self.sorted_primary_ports:
             if primary_port != LoggingConfigCli and (
                 not self.one_shot or primary_port.is_one_shot_compatible
             ):
@@ -817,6 +1196,21 @@ class PythonEDA(PythonedaApplication):
         """
         pass
 
+    @classmethod
+    def full_class_name_of(cls, targetClass: Type) -> str:
+        """
+        Retrieves the full class name of given class, caching it.
+        :param targetClass: The class, providing a full_class_name() method.
+        :type targetClass: type
+        :return: Such name.
+        :rtype: str
+        """
+        result = cls._full_class_names.get(targetClass, None)
+        if result is None:
+            result = targetClass.full_class_name()
+            cls._full_class_names[targetClass] = result
+        return result
+
     async def accept(self, eventOrEvents) -> List:
         """
         Accepts and processes an event, potentially generating others in response.
@@ -826,61 +1220,116 @@ class PythonEDA(PythonedaApplication):
         :rtype: List[pythoneda.shared.Event]
         """
         result = []
-        if eventOrEvents:
-            first_events = []
-            from pythoneda.shared import EventListener, PrimaryPort
-
-            if isinstance(eventOrEvents, Iterable):
-                events = eventOrEvents
-            else:
-                events = [eventOrEvents]
-            for event in events:
-                for listener_class in EventListener.listeners_for(event.__class__):
-                    if not self.one_shot or (
-                        not issubclass(listener_class, PrimaryPort)
+        # bound once, since they are used for every event
+        extend_missing_items = self.__class__.extend_missing_items
+        # the emissions run while the events get dispatched, and are awaited
+        # at the end, so a failing one doesn't abort the dispatch
+        emissions = []
+        try:
+            if eventOrEvents:
+                if isinstance(eventOrEvents, Iterable):
+                    pending = deque(eventOrEvents)
+                else:
+                    pending = deque([eventOrEvents])
+
+                # the events generated in response get processed in turn
+                while pending:
+                    event = pending.popleft()
+                    generated_events = []
+                    listener_classes = [
+                        listener_class
+                        for listener_class in EventListener.listeners_for(
+                            event.__class__
+                        )
+                        if not self.one_shot
+                        or not issubclass(listener_class, PrimaryPort)
                         or listener_class.is_one_shot_compatible
+                    ]
+                    if PythonEDA._debug_enabled:
+                        for listener_class in listener_classes:
+                            PythonEDA.log_debug(
+                                f"Delegating {PythonEDA.full_class_name_of(event.__class__)} to {PythonEDA.full_class_name_of(listener_class)}"
+                            )
+                    # the listeners run in order, unless all of them declare
+                    # they can run concurrently
+                    if len(listener_classes) > 1 and all(
+                        getattr(listener_class, "accepts_concurrently", False)
+                        for listener_class in listener_classes
                     ):
-                        PythonEDA.log_debug(
-                            f"Delegating {event.__class__.full_class_name()} to {listener_class.full_class_name()}"
+                        all_resulting_events = await asyncio.gather(
+                            *[
+                                listener_class.accept(event)
+                                for listener_class in listener_classes
+                            ]
                         )
-                        resulting_events = await listener_class.accept(event)
+                    else:
+                        all_resulting_events = [
+                            await listener_class.accept(event)
+                            for listener_class in listener_classes
+                        ]
+                    # no tasks get created when there's nothing to emit
+                    emitting = bool(PythonEDA.event_emitters())
+                    for resulting_events in all_resulting_events:
                         for new_event in resulting_events:
-                            asyncio.create_task(self.emit(new_event))
-                        if resulting_events and len(resulting_events) > 0:
-                            self.__class__.extend_missing_items(
-                                first_events, resulting_events
-                            )
-                triggered = await event.maybe_trigger()
-                if len(triggered) > 0:
-                    self.__class__.extend_missing_items(first_events, triggered)
-
-            if len(first_events) > 0:
-                self.__class__.extend_missing_items(result, first_events)
-
-        await asyncio.gather()
+                            if emitting and new_event:
+                                task = asyncio.create_task(self.emit(new_event))
+                                emissions.append((new_event, task))
+                        if resulting_events:
+                            extend_missing_items(generated_events, resulting_events)
+                    triggered = await event.maybe_trigger()
+                    if triggered:
+                        extend_missing_items(generated_events, triggered)
+
+                    known = len(result)
+                    extend_missing_items(result, generated_events)
+                    pending.extend(result[known:])
+        finally:
+            if emissions:
+                outcomes = await asyncio.gather(
+                    *[task for _, task in emissions], return_exceptions=True
+                )
+                for (new_event, _), outcome in zip(emissions, outcomes):
+                    if isinstance(outcome, BaseException):
+                        PythonEDA.log_error("Cannot emit %s: %s", new_event, outcome)
 
-        aux = []
-        for evt in result:
-            self.__class__.extend_missing_items(aux, await self.accept(evt))
+        return result
 
-        self.__class__.extend_missing_items(result, aux)
+    @classmethod
+    def event_emitters(cls) -> List:
+        """
+        Retrieves the event emitters, resolving them only once.
+        :return: Such emitters.
+        :rtype: List[pythoneda.shared.EventEmitter]
+        """
+        if PythonEDA._cached_event_emitters is None:
+            PythonEDA._cached_event_emitters = [
+                event_emitter
+                for event_emitter in Ports.instance().resolve(EventEmitter)
+                if event_emitter is not None
+            ]
+        return PythonEDA._cached_event_emitters
 
-        return result
+    @classmethod
+    def invalidate_event_emitter_cache(cls):
+        """
+        Discards the resolved event emitters, i.e. after the ports get initialized again.
+        """
+        PythonEDA._cached_event_emitters = None
 
     @staticmethod
     async def emit(event):
         """
-        Emits given event.
+        Emits given event to all event emitters.
         :param event: The event to emit.
         :type event: pythoneda.shared.Event
         """
-        if event:
-            from pythoneda.shared import EventEmitter, Ports
-
-            event_emitters = Ports.instance().resolve(EventEmitter)
-            for event_emitter in event_emitters:
-                if event_emitter is not None:
-                    await event_emitter.emit(event)
+        if not event:
+            return
+        event_emitters = PythonEDA.event_emitters()
+        if event_emitters:
+            await asyncio.gather(
+                *[event_emitter.emit(event) for event_emitter in event_emitters]
+            )
 
     def accept_configure_logging(self, logConfig: Dict[str, bool]):
         """
@@ -888,6 +1337,7 @@ class PythonEDA(PythonedaApplication):
         :param logConfig: The logging config.
         :type logConfig: Dict[str, bool]
         """
+        PythonEDA._debug_enabled = bool(logConfig["debug"] or logConfig["trace"])
         module_function = self.__class__.get_log_config()
         if module_function:
             module_function(
@@ -915,52 +1365,82 @@ class PythonEDA(PythonedaApplication):
         :param config: The config.
         :type config: Dict[str, str]
         """
-        module = config.get("PERSISTENCE_MODULE", None)
-        if module:
-            os.environ["PERSISTENCE_MODULE"] = module
+        if not config:
+            return
+        updates = {
+            key: value
+            for key in _EVENTSOURCING_SETTINGS
+            if (value := config.get(key))
+        }
+        os.environ.update(updates)
+        # event sourcing is applied once the whole environment is set
+        if "PERSISTENCE_MODULE" in updates:
             self.apply_eventsourcing()
-        esdb_uri = config.get("EVENTSTOREDB_URI", None)
-        if esdb_uri:
-            os.environ["EVENTSTOREDB_URI"] = esdb_uri
-        esdb_root_certificates = config.get("EVENTSTOREDB_ROOT_CERTIFICATES", None)
-        if esdb_root_certificates:
-            os.environ["EVENTSTOREDB_ROOT_CERTIFICATES"] = esdb_root_certificates
-        sqlite_db_name = config.get("SQLITE_DBNAME", None)
-        if sqlite_db_name:
-            os.environ["SQLITE_DBNAME"] = sqlite_db_name
 
     def apply_eventsourcing(self):
         """
         Performs changes in PythonEDA classes to support event sourcing.
+        The bases are changed in place, since the domain classes already extend
+        Entity and Event. Each change invalidates the type caches, so the bases
+        are only assigned when they differ, and this happens once per process.
         """
-        from pythoneda.shared import Entity, Event, ValueObject
-        from eventsourcing.domain import Aggregate
+        if PythonEDA._eventsourcing_applied:
+            return
+
+        Entity, Event, ValueObject, Aggregate = _load_es_bases()
 
-        Entity.__bases__ = (ValueObject, Aggregate)
-        Event.__bases__ = (ValueObject, Aggregate.Event)
+        changes = [
+            (target, bases)
+            for target, bases in (
+                (Entity, (ValueObject, Aggregate)),
+                (Event, (ValueObject, Aggregate.Event)),
+            )
+            if target.__bases__ != bases
+        ]
+        # a subclass is rebased before its parent, so the parent's change is
+        # the last one recomputing the subclass' MRO
+        if issubclass(Event, Entity):
+            changes.reverse()
+        for target, bases in changes:
+            target.__bases__ = bases
+        PythonEDA._eventsourcing_applied = True
+
+    @classmethod
+    def find_logging_config_module(cls):
+        """
+        Retrieves the enabled module providing the logging configuration.
+        :return: Such module, or None if it's not enabled.
+        :rtype: builtins.module
+        """
+        return PythonEDA._logging_config_module
 
     @classmethod
     def get_log_config(cls) -> Callable:
         """
         Retrieves the function to configure the logging system.
+        The result is cached until the logging_config module gets enabled.
         :return: Such function.
         :rtype: Callable
         """
+        if PythonEDA._log_config_resolved:
+            return PythonEDA._log_config
+
         result = None
 
-        for module in PythonEDA.enabled_infrastructure_modules:
-            if (
-                module.__name__
-                == "pythoneda.shared.infrastructure.logging.logging_config"
-            ):
-                entry = {}
-                configure_logging_function = getattr(module, "configure_logging", None)
-                if callable(configure_logging_function):
-                    result = configure_logging_function
-                else:
-                    PythonEDA.log_error(
-                        f"Error in {module.__file__}: configure_logging"
-                    )
+        module = cls.find_logging_config_module()
+
+        if module is not None:
+            try:
+                configure_logging_function = _get_configure_logging(module)
+            except AttributeError:
+                configure_logging_function = None
+            if callable(configure_logging_function):
+                result = configure_logging_function
+            else:
+                PythonEDA.log_error("Error in %s: configure_logging", module.__file__)
+
+        PythonEDA._log_config = result
+        PythonEDA._log_config_resolved = True
         return result
 
     @classmethod
@@ -972,7 +1452,22 @@ class PythonEDA(PythonedaApplication):
         :param second: The second list.
         :type second: List
         """
-        [first.append(item) for item in second if item not in first]
+        try:
+            seen = set(first)
+            append = first.append
+            for item in second:
+                if item not in seen:
+                    seen.add(item)
+                    append(item)
+        except TypeError:
+            # unhashable items: the very same objects are skipped by identity,
+            # the rest get compared one by one (including the ones already
+            # appended above)
+            known = set(map(id, first))
+            for item in second:
+                if id(item) not in known and item not in first:
+                    known.add(id(item))
+                    first.append(item)
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
@@ -989,22 +1484,38 @@ class PythonEDA(PythonedaApplication):
         :return: Such packages.
         :rtype: List
         """
-        # Get the module's fully qualified name
-        module_name = self.__class__.__module__
-
-        # Split the module name and build the list of progressively longer package paths
-        parts = module_name.split(".")
-        return [".".join(parts[: i + 1]) for i in range(len(parts))]
+        result = PythonEDA._application_packages.get(self.__class__, None)
+        if result is None:
+            # Split the module's fully qualified name and build the list of
+            # progressively longer package paths
+            result = []
+            current = ""
+            for part in self.__class__.__module__.split("."):
+                current = f"{current}.{part}" if current else part
+                result.append(current)
+            PythonEDA._application_packages[self.__class__] = result
 
+        return list(result)
 
-import asyncio
-import importlib
-import importlib.util
-import os
-import sys
 
 if __name__ == "__main__":
-    asyncio.run(PythonEDA.main())
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        uvloop = None
+        loop_factory = None
+
+    runner_class = getattr(asyncio, "Runner", None)
+    if runner_class is None:
+        # Python < 3.11: the loop can only be chosen through the policy
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(PythonEDA.main())
+    else:
+        with runner_class(loop_factory=loop_factory) as runner:
+            runner.run(PythonEDA.main())
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
 # mode: python
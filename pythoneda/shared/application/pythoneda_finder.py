@@ -0,0 +1,203 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/shared/application/pythoneda_finder.py
+
+This file defines the PythonEDAFinder class.
+
+Copyright (C) 2023-today rydnr's pythoneda-shared-pythonlang/application
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import inspect
+import os
+from typing import Dict, List, Set
+
+# the order in which the default import machinery prefers module files
+_SUFFIXES = tuple(
+    importlib.machinery.EXTENSION_SUFFIXES
+    + importlib.machinery.SOURCE_SUFFIXES
+    + importlib.machinery.BYTECODE_SUFFIXES
+)
+
+
+class PythonEDAFinder(importlib.abc.MetaPathFinder):
+    """
+    Finds PythonEDA modules using an index built once, instead of probing sys.path.
+
+    Class name: PythonEDAFinder
+
+    Responsibilities:
+        - Indexes the modules under the PythonEDA namespaces in a single scan.
+        - Provides the specs of the indexed modules without further file-system access.
+
+    Collaborators:
+        - PythonEDA: Installs it in sys.meta_path at startup.
+    """
+
+    def __init__(self, namespaceRoots: Dict[str, List[str]]):
+        """
+        Creates a new PythonEDAFinder instance.
+        :param namespaceRoots: The namespaces and the sys.path entries providing them.
+        :type namespaceRoots: Dict[str, List[str]]
+        """
+        super().__init__()
+        self._namespace_roots = namespaceRoots
+        self._index = None
+
+    @property
+    def index(self) -> Dict:
+        """
+        Retrieves the index, building it if needed.
+        :return: The module names and their (file, folder) locations.
+        :rtype: Dict[str, Tuple[str, str]]
+        """
+        if self._index is None:
+            self._index = self.__class__.build_index(self._namespace_roots)
+        return self._index
+
+    @classmethod
+    def build_index(cls, namespaceRoots: Dict[str, List[str]]) -> Dict:
+        """
+        Indexes the modules under given namespaces.
+        Modules provided by more than one path are left out, so that the default
+        import machinery resolves them (e.g. namespace packages extending their __path__).
+        :param namespaceRoots: The namespaces and the sys.path entries providing them.
+        :type namespaceRoots: Dict[str, List[str]]
+        :return: The module names and their (file, folder) locations. The folder is None for plain modules.
+        :rtype: Dict[str, Tuple[str, str]]
+        """
+        result = {}
+        ambiguous = set()
+        for namespace, paths in namespaceRoots.items():
+            for path in paths:
+                found = {}
+                cls.scan(os.path.join(path, namespace), namespace, found)
+                for name, location in found.items():
+                    if name in result:
+                        ambiguous.add(name)
+                    else:
+                        result[name] = location
+
+        for name in ambiguous:
+            del result[name]
+
+        return result
+
+    @classmethod
+    def scan(cls, folder: str, packageName: str, result: Dict, visited: Set = None):
+        """
+        Indexes the modules of given package folder, recursively.
+        :param folder: The folder.
+        :type folder: str
+        :param packageName: The name of the package of such folder.
+        :type packageName: str
+        :param result: The index to update.
+        :type result: Dict[str, Tuple[str, str]]
+        :param visited: The real paths already scanned, to stop at symlink cycles.
+        :type visited: Set[str]
+        """
+        if visited is None:
+            visited = set()
+        real_folder = os.path.realpath(folder)
+        if real_folder in visited:
+            return
+        visited.add(real_folder)
+        subfolders = []
+        modules = {}
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name.isidentifier():
+                            subfolders.append(entry)
+                        continue
+                    name = inspect.getmodulename(entry.name)
+                    if name is None or not name.isidentifier():
+                        continue
+                    current = modules.get(name, None)
+                    if current is None or cls.suffix_rank(
+                        entry.name
+                    ) < cls.suffix_rank(current.name):
+                        modules[name] = entry
+        except OSError:
+            return
+
+        init = modules.pop("__init__", None)
+        if init is None:
+            return
+
+        result[packageName] = (init.path, folder)
+        for name, entry in modules.items():
+            result[f"{packageName}.{name}"] = (entry.path, None)
+        # packages take precedence over modules with the same name
+        for entry in subfolders:
+            cls.scan(entry.path, f"{packageName}.{entry.name}", result, visited)
+
+    @staticmethod
+    def suffix_rank(fileName: str) -> int:
+        """
+        Retrieves the precedence of given module file among the files of the same module.
+        :param fileName: The file name.
+        :type fileName: str
+        :return: The rank, lower meaning preferred.
+        :rtype: int
+        """
+        for rank, suffix in enumerate(_SUFFIXES):
+            if fileName.endswith(suffix):
+                return rank
+        return len(_SUFFIXES)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        """
+        Finds the spec of given module, if indexed.
+        :param fullname: The fully-qualified name of the module.
+        :type fullname: str
+        :param path: The __path__ of the parent package (unused).
+        :type path: List[str]
+        :param target: The module being reloaded, if any (unused).
+        :type target: module
+        :return: The spec, or None to let other finders look for it.
+        :rtype: importlib.machinery.ModuleSpec
+        """
+        location = self.index.get(fullname, None)
+        if location is None:
+            return None
+
+        file, folder = location
+        if folder is None:
+            return importlib.util.spec_from_file_location(fullname, file)
+
+        return importlib.util.spec_from_file_location(
+            fullname, file, submodule_search_locations=[folder]
+        )
+
+    def invalidate_caches(self):
+        """
+        Discards the index, so that it gets rebuilt on the next lookup.
+        It's called by importlib.invalidate_caches(), i.e. when files could have changed.
+        """
+        self._index = None
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End: